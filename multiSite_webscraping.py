@@ -1,22 +1,77 @@
 import csv
 import json
+import multiprocessing
 import re
+import os
+import threading
 import time
-from urllib.parse import urlparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import lru_cache, partial
+from itertools import islice
+from operator import itemgetter
+from urllib.parse import urlsplit, urlunsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+from urllib3.util.retry import Retry
+
+try:
+    # several times faster than the stdlib decoder on large JSON-LD blobs
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
 
 USE_PLAYWRIGHT_FALLBACK = True
 
 MAX_URLS = 300
 
+# discovered URLs that never yield article text: social sites, listing pages, PDFs
+SKIP_DOMAIN_RE = re.compile(r"(^|\.)(facebook|twitter|x|youtube|linkedin|reddit|instagram|tiktok)\.com$")
+SKIP_PATH_RE = re.compile(r"/(tag|tags|category|categories)/|\.pdf$", re.IGNORECASE)
+
+# minimum gap between two requests to the same host
 SLEEP_SECONDS = 1.5
 
+# on-disk HTTP cache (used when requests-cache is installed): pages are kept
+# for a week, GDELT discovery results only for an hour
+CACHE_NAME = "scrape_cache"
+CACHE_EXPIRE_AFTER = timedelta(days=7)
+GDELT_CACHE_EXPIRE_AFTER = timedelta(hours=1)
+
+GDELT_HOST = "api.gdeltproject.org"
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+
+MAX_WORKERS = 20
+
+# Playwright fallback: resource types and tracker hosts not worth downloading
+BLOCKED_RESOURCE_TYPES = ("image", "font", "media", "stylesheet", "websocket", "other")
+
+TRACKER_RE = re.compile(
+    r"doubleclick\.net|googlesyndication\.com|google-analytics\.com|googletagmanager\.com"
+    r"|facebook\.net|amazon-adsystem\.com|adnxs\.com|scorecardresearch\.com"
+    r"|taboola\.com|outbrain\.com|chartbeat\.com|quantserve\.com|hotjar\.com"
+)
+
+PARSE_WORKERS = os.cpu_count() or 1
+
+# lxml's C parser is much faster than the pure-Python html.parser; use it when installed
+HTML_PARSER = "lxml" if builder_registry.lookup("lxml") else "html.parser"
+
 PERCENT_PATTERNS = [
     r"\b\d+(\.\d+)?\s*%",                               # 12% , 12.5%
-    r"\b\d+(\.\d+)?\s*(percent|percentage)\b",          # 12 percent
     r"\b\d+(\.\d+)?\s*(percentage points|pp)\b",        # 5 percentage points, 5 pp
+    r"\b\d+(\.\d+)?\s*(percent|percentage)\b",          # 12 percent
 ]
 
 TIME_PATTERNS = [
@@ -32,20 +87,104 @@ CHANGE_KEYWORDS = [
     "documentation", "burden", "workload", "productivity", "efficient", "efficiency"
 ]
 
+# compiled once at import: a single scan finds both kinds of metric,
+# and the named group that matched (m.lastgroup) says which one it was
+METRIC_RE = re.compile(
+    "(?P<percent>" + "|".join(PERCENT_PATTERNS) + ")|(?P<time>" + "|".join(TIME_PATTERNS) + ")",
+    re.IGNORECASE,
+)
+
+def minimal_keywords(keywords):
+    """
+    Drops keywords that contain a shorter keyword ("increased" -> "increase").
+    For a substring test they can never change the answer, they only add
+    branches the regex has to try at every position.
+    """
+    kept = []
+    for k in sorted({k.lower() for k in keywords}, key=len):
+        if not any(short in k for short in kept):
+            kept.append(k)
+    return kept
+
+
+# spaces in a keyword match any whitespace run, so the raw article text
+# can be tested directly, before clean() collapses it
+CHANGE_RE = re.compile(
+    "|".join(re.escape(k).replace(r"\ ", r"\s+") for k in minimal_keywords(CHANGE_KEYWORDS)),
+    re.IGNORECASE,
+)
+
+WS_RE = re.compile(r"\s+")
+GETTY_RE = re.compile(r"\bvia getty\b|\b/getty\b", re.IGNORECASE)
+ARTICLE_TYPES = ("NewsArticle", "Article", "BlogPosting", "ReportageNewsArticle")
+
+# cheap pre-check that some "@type" value names an article type; JSON-LD blobs
+# that fail it (BreadcrumbList, Organization, WebSite, ...) are never decoded
+ARTICLE_LD_RE = re.compile(r'"@type"\s*:\s*(?:"[^"]*|\[[^\]]*)(?:Article|BlogPosting)')
+
+PUBLISHED_RE = re.compile(r"Published:\s*([0-9]{1,2}\s+[A-Za-z]{3}\s+[0-9]{4})")
+
+@dataclass(slots=True)
+class ScrapedRow:
+    """One scraped page; error is set (and the page fields left empty) when the fetch failed."""
+    url: str
+    site: str
+    title: str | None = None
+    author: str | None = None
+    published_date: str | None = None
+    description: str | None = None
+    body: str | None = None
+    error: str | None = None
+
+
 def clean(s):
     if s is None:
         return None
-    s = re.sub(r"\s+", " ", str(s)).strip()
+    s = WS_RE.sub(" ", str(s)).strip()
     return s if s else None
 
 
+@lru_cache(maxsize=4096)
 def get_domain(url: str) -> str:
-    return urlparse(url).netloc.lower()
+    return urlsplit(url).netloc.lower()
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Dedupe key for a URL: lowercases scheme/host and drops utm_* params
+    and the fragment, so the same article shared with different tracking
+    tags dedupes. The query is split on "&" without decoding, so the
+    remaining params stay byte-for-byte as they were.
+    Raises ValueError on malformed URLs (as urlsplit does).
+    """
+    parts = urlsplit(url)
+    query = "&".join(p for p in parts.query.split("&") if p and not p.lower().startswith("utm_"))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
 
+def should_fetch(url: str) -> bool:
+    parts = urlsplit(url)
+    host = parts.hostname or ""  # lowercased, without userinfo/port/IPv6 brackets
+    return not (SKIP_DOMAIN_RE.search(host) or SKIP_PATH_RE.search(parts.path))
 
-def meta_content(soup, *, name=None, prop=None):
-    tag = soup.find("meta", attrs={"name": name}) if name else soup.find("meta", attrs={"property": prop})
-    return clean(tag.get("content")) if tag and tag.get("content") else None
+
+def index_meta(soup):
+    """
+    Collects every <meta name=...>/<meta property=...> content in one walk
+    of the tree, so each meta_content lookup is a dict hit instead of a
+    full soup.find. The first tag for each key wins, as with find.
+    """
+    metas = {}
+    for tag in soup.find_all("meta"):
+        for attr in ("name", "property"):
+            key = tag.get(attr)
+            if key:
+                metas.setdefault((attr, key), tag.get("content"))
+    return metas
+
+def meta_content(metas, *, name=None, prop=None):
+    content = metas.get(("name", name)) if name else metas.get(("property", prop))
+    return clean(content) if content else None
 
 def first_text(soup, selectors):
     for sel in selectors:
@@ -54,6 +193,14 @@ def first_text(soup, selectors):
             return clean(el.get_text(" ", strip=True))
     return None
 
+def json_loads(raw: str):
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity literals, which json.loads accepts
+    return json.loads(raw)
+
 def parse_json_ld_for_article(soup):
     """
     Extract author + datePublished from JSON-LD if present.
@@ -63,8 +210,10 @@ def parse_json_ld_for_article(soup):
         raw = s.string or s.get_text(strip=True)
         if not raw:
             continue
+        if not ARTICLE_LD_RE.search(raw):
+            continue
         try:
-            data = json.loads(raw)
+            data = json_loads(str(raw))  # orjson rejects bs4's str subclasses
         except Exception:
             continue
 
@@ -77,7 +226,7 @@ def parse_json_ld_for_article(soup):
             if isinstance(t, list):
                 t = " ".join(map(str, t))
 
-            if t and any(x in str(t) for x in ["NewsArticle", "Article", "BlogPosting", "ReportageNewsArticle"]):
+            if t and any(x in str(t) for x in ARTICLE_TYPES):
                 author = obj.get("author")
                 author_name = None
                 if isinstance(author, dict):
@@ -101,8 +250,9 @@ def discover_urls_gdelt(max_urls=300, timespan="1y", retries=3):
     Auto-discovers URLs using GDELT DOC 2.0.
     Uses short queries (GDELT has query length limits).
     Tries multiple queries from richer -> simpler.
+    Skips URLs that should_fetch() rejects and dedupes on canonicalize_url().
     """
-    endpoint = "https://api.gdeltproject.org/api/v2/doc/doc"
+    endpoint = f"https://{GDELT_HOST}/api/v2/doc/doc"
 
     queries_to_try = [
         '("generative AI" OR "AI adoption") (productivity OR "time saved" OR efficiency) sourcecountry:unitedstates',
@@ -127,7 +277,7 @@ def discover_urls_gdelt(max_urls=300, timespan="1y", retries=3):
         last_err = None
         for attempt in range(1, retries + 1):
             try:
-                r = requests.get(endpoint, params=params, timeout=30)
+                r = get_session().get(endpoint, params=params, timeout=30)
                 ctype = r.headers.get("Content-Type", "")
                 print(f"GDELT query='{q[:60]}...' attempt {attempt}/{retries} -> status={r.status_code}, content-type={ctype}")
 
@@ -143,9 +293,13 @@ def discover_urls_gdelt(max_urls=300, timespan="1y", retries=3):
                     if not u:
                         continue
                     u = u.strip()
-                    if u in seen:
-                        continue
-                    seen.add(u)
+                    try:
+                        key = canonicalize_url(u)
+                        if key in seen or not should_fetch(u):
+                            continue
+                    except ValueError:
+                        continue  # malformed URL, e.g. "http://[::1"
+                    seen.add(key)
                     all_urls.append(u)
                     if len(all_urls) >= max_urls:
                         return all_urls
@@ -168,36 +322,101 @@ def discover_urls_gdelt(max_urls=300, timespan="1y", retries=3):
     return all_urls[:max_urls]
 
 #for fetching the page html
-def fetch_with_requests(url: str):
-    session = requests.Session()
+def is_cacheable(response) -> bool:
+    """
+    GDELT answers errors and rate limits with a 200 plain-text/HTML body;
+    caching that would make every retry read the same error for an hour.
+    """
+    if get_domain(response.url) == GDELT_HOST:
+        return "json" in response.headers.get("Content-Type", "").lower()
+    return True
+
+def make_session():
+    """
+    One shared session for every request, so repeat hosts reuse pooled
+    keep-alive connections instead of a new TCP+TLS handshake. With
+    requests-cache installed, responses are also cached in SQLite so
+    reruns read repeat URLs from disk.
+    """
+    if CachedSession is not None:
+        session = CachedSession(
+            CACHE_NAME,
+            expire_after=CACHE_EXPIRE_AFTER,
+            urls_expire_after={GDELT_HOST: GDELT_CACHE_EXPIRE_AFTER},
+            allowable_codes=(200,),
+            filter_fn=is_cacheable,
+            stale_if_error=True,
+        )
+    else:
+        session = requests.Session()
     session.headers.update({
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+        "User-Agent": USER_AGENT,
         "Accept-Language": "en-US,en;q=0.9",
         "Referer": "https://google.com/",
         "Connection": "keep-alive",
     })
-    r = session.get(url, timeout=25)
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# built on first use rather than at import, so importing the module (or a
+# spawned parse worker, which never fetches) doesn't create the cache file
+SESSION = None
+SESSION_LOCK = threading.Lock()
+
+
+def get_session():
+    global SESSION
+    with SESSION_LOCK:
+        if SESSION is None:
+            SESSION = make_session()
+    return SESSION
+
+
+def fetch_with_requests(url: str):
+    r = get_session().get(url, timeout=25)
     return r.status_code, r.text
 
 
-def fetch_with_playwright(url: str):
-    from playwright.sync_api import sync_playwright
+# Playwright's sync API must be driven from the thread that started it, so one
+# dedicated thread owns a single browser that every fallback fetch reuses
+PLAYWRIGHT_THREAD = ThreadPoolExecutor(max_workers=1)
+PLAYWRIGHT = None
+BROWSER = None
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
-            locale="en-US",
-        )
-        page = context.new_page()
 
-        page.route(
-            "**/*",
-            lambda route: route.abort()
-            if route.request.resource_type in ("image", "font", "media")
-            else route.continue_()
-        )
+def block_heavy_requests(route):
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or TRACKER_RE.search(request.url):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def render_with_playwright(url: str):
+    global PLAYWRIGHT, BROWSER
+    if BROWSER is None:
+        from playwright.sync_api import sync_playwright
 
+        PLAYWRIGHT = sync_playwright().start()
+        try:
+            BROWSER = PLAYWRIGHT.chromium.launch(headless=True)
+        except Exception:
+            # don't leave a driver running for every failed fallback
+            PLAYWRIGHT.stop()
+            PLAYWRIGHT = None
+            raise
+
+    context = BROWSER.new_context(
+        user_agent=USER_AGENT,
+        locale="en-US",
+    )
+    try:
+        page = context.new_page()
+        page.route("**/*", block_heavy_requests)
 
         page.goto(url, wait_until="domcontentloaded", timeout=60000)
 
@@ -206,9 +425,28 @@ def fetch_with_playwright(url: str):
         except Exception:
             pass
 
-        html = page.content()
-        browser.close()
-        return 200, html
+        return 200, page.content()
+    finally:
+        context.close()
+
+
+def stop_playwright():
+    global PLAYWRIGHT, BROWSER
+    if BROWSER is not None:
+        try:
+            BROWSER.close()
+        finally:
+            PLAYWRIGHT.stop()
+            PLAYWRIGHT = BROWSER = None
+
+
+def fetch_with_playwright(url: str):
+    return PLAYWRIGHT_THREAD.submit(render_with_playwright, url).result()
+
+
+def close_playwright():
+    if BROWSER is not None:
+        PLAYWRIGHT_THREAD.submit(stop_playwright).result()
 
 def extract_body_generic(soup):
     containers = [
@@ -241,49 +479,51 @@ def extract_body_generic(soup):
     if not texts:
         return clean(container.get_text(" ", strip=True))
 
-    if len(texts) > 1 and re.search(r"\bvia getty\b|\b/getty\b", texts[0].lower()):
+    if len(texts) > 1 and GETTY_RE.search(texts[0]):
         texts = texts[1:]
 
     return "\n\n".join(texts)
 
-def parse_page_generic(html: str, url: str) -> dict:
-    soup = BeautifulSoup(html, "html.parser")
+def parse_page_generic(html: str, url: str) -> ScrapedRow:
+    soup = BeautifulSoup(html, HTML_PARSER)
+    metas = index_meta(soup)
 
-    title = first_text(soup, ["h1"]) or meta_content(soup, prop="og:title") or first_text(soup, ["title"])
-    description = meta_content(soup, name="description") or meta_content(soup, prop="og:description")
+    title = first_text(soup, ["h1"]) or meta_content(metas, prop="og:title") or first_text(soup, ["title"])
+    description = meta_content(metas, name="description") or meta_content(metas, prop="og:description")
 
     author_ld, date_ld = parse_json_ld_for_article(soup)
-    author = author_ld or meta_content(soup, name="author") or meta_content(soup, prop="article:author")
+    author = author_ld or meta_content(metas, name="author") or meta_content(metas, prop="article:author")
 
     published = (
         date_ld
-        or meta_content(soup, prop="article:published_time")
-        or meta_content(soup, name="pubdate")
-        or meta_content(soup, name="date")
+        or meta_content(metas, prop="article:published_time")
+        or meta_content(metas, name="pubdate")
+        or meta_content(metas, name="date")
     )
 
     if not published:
         page_text = soup.get_text("\n", strip=True)
-        m = re.search(r"Published:\s*([0-9]{1,2}\s+[A-Za-z]{3}\s+[0-9]{4})", page_text)
+        m = PUBLISHED_RE.search(page_text)
         if m:
             published = clean(m.group(1))
 
     body = extract_body_generic(soup)
 
-    return {
-        "url": url,
-        "site": get_domain(url),
-        "title": title,
-        "author": author,
-        "published_date": published,
-        "description": description,
-        "body": body,
-        "error": None,
-    }
-
-def snippet_has_change_context(snippet: str) -> bool:
-    t = (snippet or "").lower()
-    return any(k in t for k in CHANGE_KEYWORDS)
+    return ScrapedRow(
+        url=url,
+        site=get_domain(url),
+        title=title,
+        author=author,
+        published_date=published,
+        description=description,
+        body=body,
+    )
+
+def snippet_has_change_context(snippet: str, start: int = 0, end: int | None = None) -> bool:
+    """True if snippet[start:end] mentions a change keyword; searches in place, without slicing."""
+    if not snippet:
+        return False
+    return CHANGE_RE.search(snippet, start, len(snippet) if end is None else end) is not None
 
 def extract_percent_and_time_snippets(text: str, window: int = 90, max_hits: int = 80):
     if not text:
@@ -291,106 +531,172 @@ def extract_percent_and_time_snippets(text: str, window: int = 90, max_hits: int
 
     hits = []
 
-    # Percent
-    for pat in PERCENT_PATTERNS:
-        for m in re.finditer(pat, text, flags=re.IGNORECASE):
-            start = max(0, m.start() - window)
-            end = min(len(text), m.end() + window)
-            snippet = clean(text[start:end])
-            if snippet and snippet_has_change_context(snippet):
-                hits.append({"metric_type": "percent", "value": m.group(0), "snippet": snippet})
-            if len(hits) >= max_hits:
-                return hits
-
-    # Time
-    for pat in TIME_PATTERNS:
-        for m in re.finditer(pat, text, flags=re.IGNORECASE):
-            start = max(0, m.start() - window)
-            end = min(len(text), m.end() + window)
-            snippet = clean(text[start:end])
-            if snippet and snippet_has_change_context(snippet):
-                hits.append({"metric_type": "time", "value": m.group(0), "snippet": snippet})
-            if len(hits) >= max_hits:
-                return hits
+    for m in METRIC_RE.finditer(text):
+        start = max(0, m.start() - window)
+        end = min(len(text), m.end() + window)
+        # most windows have no change keyword; test in place before slicing/cleaning
+        if not snippet_has_change_context(text, start, end):
+            continue
+        snippet = clean(text[start:end])
+        if snippet:
+            hits.append({"metric_type": m.lastgroup, "value": m.group(0), "snippet": snippet})
+        if len(hits) >= max_hits:
+            return hits
 
     return hits
 
 
-def build_numbers_table(rows, max_snippets_per_url: int = 6):
-    out = []
+def iter_numbers(rows, max_snippets_per_url: int = 6):
+    """
+    Yields one CSV row per snippet as each scraped row comes in, so a page
+    body can be dropped as soon as its snippets have been extracted.
+    """
     for r in rows:
-        if r.get("error"):
+        if r.error:
             continue
 
-        combined = f"{r.get('description') or ''}\n\n{r.get('body') or ''}"
+        combined = f"{r.description or ''}\n\n{r.body or ''}"
         snippets = extract_percent_and_time_snippets(combined, window=90, max_hits=80)
 
         if not snippets:
             continue
 
         for s in snippets[:max_snippets_per_url]:
-            out.append({
-                "url": r.get("url"),
-                "site": r.get("site"),
-                "title": r.get("title"),
-                "published_date": r.get("published_date"),
+            yield {
+                "url": r.url,
+                "site": r.site,
+                "title": r.title,
+                "published_date": r.published_date,
                 "metric_type": s["metric_type"],  # percent | time
                 "value": s["value"],              # e.g. "12%" or "30 minutes"
                 "context_snippet": s["snippet"],
-            })
-    return out
+            }
 
-def scrape_urls(urls):
-    results = []
-
-    for i, url in enumerate(urls, start=1):
-        print(f"\n[{i}/{len(urls)}] Scraping: {url}")
-        try:
-            status, html = fetch_with_requests(url)
-            print("requests status:", status)
-
-            if status in (403, 429) and USE_PLAYWRIGHT_FALLBACK:
-                print("blocked -> trying Playwright...")
-                status, html = fetch_with_playwright(url)
-                print("playwright status:", status)
-
-            if status != 200 or not html:
-                results.append({
-                    "url": url,
-                    "site": get_domain(url),
-                    "title": None,
-                    "author": None,
-                    "published_date": None,
-                    "description": None,
-                    "body": None,
-                    "error": f"HTTP {status}",
-                })
-            else:
-                results.append(parse_page_generic(html, url))
-
-        except Exception as e:
-            results.append({
-                "url": url,
-                "site": get_domain(url),
-                "title": None,
-                "author": None,
-                "published_date": None,
-                "description": None,
-                "body": None,
-                "error": str(e),
-            })
-
-        time.sleep(SLEEP_SECONDS)
-
-    return results
-
-def save_numbers_csv(numbers, filename="numbers.csv"):
+def build_numbers_table(rows, max_snippets_per_url: int = 6):
+    return list(iter_numbers(rows, max_snippets_per_url))
+
+# per-host politeness: the time slot each host was last given. A worker
+# reserves the next free slot for its host under the lock and sleeps
+# outside it, so the lock is never held while waiting.
+LAST_HIT = {}
+HOST_LOCK = threading.Lock()
+
+def wait_for_host(url: str):
+    host = get_domain(url)
+    with HOST_LOCK:
+        now = time.monotonic()
+        slot = max(now, LAST_HIT.get(host, float("-inf")) + SLEEP_SECONDS)
+        LAST_HIT[host] = slot
+    if slot > now:
+        time.sleep(slot - now)
+
+def interleave_by_host(urls):
+    """
+    Round-robins urls across hosts (in first-seen order), so a cluster of
+    one host's URLs can't tie up every worker waiting on that host's
+    slots while other hosts sit idle in the queue.
+    """
+    by_host = {}
+    for url in urls:
+        by_host.setdefault(get_domain(url), deque()).append(url)
+    queues = deque(by_host.values())
+    while queues:
+        q = queues.popleft()
+        yield q.popleft()
+        if q:
+            queues.append(q)
+
+def is_cached(url: str) -> bool:
+    """True only if the cache holds a response for url that hasn't expired yet."""
+    session = get_session()
+    if CachedSession is None or not isinstance(session, CachedSession):
+        return False
+    response = session.cache.get_response(session.cache.create_key(requests.Request("GET", url)))
+    return response is not None and not response.is_expired
+
+def scrape_url(url: str, parse_pool=None) -> ScrapedRow:
+    """
+    Fetches one URL and parses it. With parse_pool (a ProcessPoolExecutor)
+    the HTML parse runs in a worker process so it doesn't hold the GIL
+    while other threads are parsing too.
+    """
+    try:
+        # a cache hit never reaches the host, so it doesn't need to wait its turn
+        if not is_cached(url):
+            wait_for_host(url)
+        status, html = fetch_with_requests(url)
+        print(f"requests status: {status} ({url})")
+
+        if status in (403, 429) and USE_PLAYWRIGHT_FALLBACK:
+            print(f"blocked -> trying Playwright... ({url})")
+            wait_for_host(url)
+            status, html = fetch_with_playwright(url)
+            print(f"playwright status: {status} ({url})")
+
+        if status != 200 or not html:
+            return ScrapedRow(url=url, site=get_domain(url), error=f"HTTP {status}")
+        if parse_pool is not None:
+            return parse_pool.submit(parse_page_generic, html, url).result()
+        return parse_page_generic(html, url)
+
+    except Exception as e:
+        return ScrapedRow(url=url, site=get_domain(url), error=str(e))
+
+def iter_scraped(urls, max_workers=MAX_WORKERS, parse_workers=PARSE_WORKERS):
+    """
+    Fetches the URLs on a thread pool (the work is mostly waiting on the
+    network) and hands each page to a process pool for parsing, so fetching
+    and parsing overlap. URLs are submitted round-robin by host (see
+    interleave_by_host) and rows are yielded in that submission order.
+    Only about 2 x max_workers of them are in flight at once, so memory
+    doesn't grow with the number of URLs.
+    """
+    try:
+        # spawn, not fork: the first submit comes from a fetch thread while the
+        # other fetch threads hold sockets/locks a forked child would inherit
+        with ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context("spawn")) as parse_pool, \
+                ThreadPoolExecutor(max_workers=max_workers) as pool:
+            scrape = partial(scrape_url, parse_pool=parse_pool)
+            pending = deque()
+            done = 0
+
+            for url in interleave_by_host(urls):
+                pending.append(pool.submit(scrape, url))
+                while len(pending) >= 2 * max_workers or (pending and pending[0].done()):
+                    done += 1
+                    yield report_scraped(pending.popleft().result(), done, len(urls))
+
+            while pending:
+                done += 1
+                yield report_scraped(pending.popleft().result(), done, len(urls))
+    finally:
+        close_playwright()
+
+def report_scraped(row: ScrapedRow, i: int, total: int) -> ScrapedRow:
+    print(f"[{i}/{total}] Scraped: {row.url}" + (f" -> {row.error}" if row.error else ""))
+    return row
+
+def scrape_urls(urls, max_workers=MAX_WORKERS, parse_workers=PARSE_WORKERS):
+    return list(iter_scraped(urls, max_workers, parse_workers))
+
+def save_numbers_csv(numbers, filename="numbers.csv", batch_size=500):
+    """
+    Missing fields are filled with None (written as an empty cell), then
+    each row is turned into a tuple with a single itemgetter call.
+    numbers can be any iterable (e.g. the iter_numbers generator); it is
+    written in batches as it's consumed. Returns the number of rows written.
+    """
     fieldnames = ["url", "site", "title", "published_date", "metric_type", "value", "context_snippet"]
+    blank = dict.fromkeys(fieldnames)
+    rows = map(itemgetter(*fieldnames), ({**blank, **row} for row in numbers))
+    written = 0
     with open(filename, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for row in numbers:
-            w.writerow({k: row.get(k) for k in fieldnames})
+        w = csv.writer(f)
+        w.writerow(fieldnames)
+        while batch := list(islice(rows, batch_size)):
+            w.writerows(batch)
+            written += len(batch)
+    return written
 
 
 if __name__ == "__main__":
@@ -403,11 +709,10 @@ if __name__ == "__main__":
     if len(urls) > 25:
         print(f"... (showing first 25 of {len(urls)})")
 
-    # 2) Scrape them
-    rows = scrape_urls(urls)
-
+    # 2) Scrape them, streaming rows straight into the CSV
+    rows = iter_scraped(urls)
 
-    numbers = build_numbers_table(rows, max_snippets_per_url=6)
-    save_numbers_csv(numbers, "numbers.csv")
+    numbers = iter_numbers(rows, max_snippets_per_url=6)
+    written = save_numbers_csv(numbers, "numbers.csv")
 
-    print(f"\nDone. Saved ->  numbers.csv ({len(numbers)} rows)")
+    print(f"\nDone. Saved ->  numbers.csv ({written} rows)")